@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
-from dotenv import load_dotenv
 import os
-from binance.client import Client
 
-load_dotenv()
+if not os.getenv('BINANCE_API_KEY'):
+    from dotenv import load_dotenv
+    load_dotenv()
 API_KEY = os.getenv('BINANCE_API_KEY')
 API_SECRET = os.getenv('BINANCE_API_SECRET')
 
@@ -12,6 +12,8 @@ if not API_KEY or not API_SECRET:
     print('No API keys found in .env')
     raise SystemExit(1)
 
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
 client = Client(API_KEY, API_SECRET)
 client.API_URL = 'https://testnet.binance.vision/api'
 client.FUTURES_API_URL = 'https://testnet.binance.vision/fapi'
@@ -24,12 +26,11 @@ try:
     print('Success: fetched futures account balance:')
     for b in balances:
         print(f"  {b['asset']}: {b.get('balance')}")
-except Exception as e:
-    err = repr(e)
+except BinanceAPIException as e:
     print('Error while verifying keys:')
-    print(err)
+    print(repr(e))
 
-    if '-2015' in err or 'Invalid API-key' in err:
+    if e.code == -2015:
         print('\nDetected Binance API error -2015 (Invalid API-key, IP, or permissions).')
         print('Common causes and fixes:')
         print('  1) You created API keys on Binance mainnet instead of the *Futures Testnet*.')
@@ -42,3 +43,7 @@ except Exception as e:
         print(' - walk you step-by-step through creating testnet keys, or')
         print(' - check your .env file contents (locally) for formatting issues (I will not read your keys).')
     raise SystemExit(1)
+except Exception as e:
+    print('Error while verifying keys (network or client error):')
+    print(repr(e))
+    raise SystemExit(1)
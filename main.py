@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import os
-from typing import Dict, Any, Optional
-from dotenv import load_dotenv
+import sys
+import cmd
+import shlex
+from typing import Dict, Any, List, Optional
 import argparse
+import importlib
+from functools import lru_cache
 from src.common import BasicBot, logger
-from src.market_order import MarketOrder
-from src.limit_order import LimitOrder
-from src.advance.oco import OCOOrder
-from src.advance.stop_limit import StopLimitOrder
-from src.advance.twap import TWAPStrategy
-from src.advance.grid import GridStrategy
+
+# Common zero renderings, skipped without a float() conversion.
+ZERO_BALANCES = frozenset(('0', '0.0', '0.00', '0.00000000'))
+# Global options applied once by init_client; the interactive shell cannot change them per command.
+SESSION_FLAGS = frozenset(('--dry-run', '--ws-orders'))
 
 def display_balance(bot: BasicBot):
     """Display current account balance."""
@@ -19,8 +24,9 @@ def display_balance(bot: BasicBot):
         print("\nAccount Balances:")
         print("-" * 40)
         for balance in balances:
-            if float(balance['balance']) > 0:
-                print(f"{balance['asset']}: {balance['balance']}")
+            amount = balance['balance']
+            if amount not in ZERO_BALANCES and float(amount) > 0:
+                print(f"{balance['asset']}: {amount}")
         print("-" * 40)
     except Exception as e:
         logger.error(f"Error getting balance: {str(e)}")
@@ -28,71 +34,30 @@ def display_balance(bot: BasicBot):
 
 def display_order_info(order: Dict[str, Any]):
     """Display order information in a formatted way."""
-    print("\nOrder Details:")
-    print("-" * 40)
-    print(f"Order ID: {order['orderId']}")
-    print(f"Symbol: {order['symbol']}")
-    print(f"Side: {order['side']}")
-    print(f"Type: {order['type']}")
-    print(f"Quantity: {order['origQty']}")
+    lines = [
+        "\nOrder Details:",
+        "-" * 40,
+        f"Order ID: {order['orderId']}",
+        f"Symbol: {order['symbol']}",
+        f"Side: {order['side']}",
+        f"Type: {order['type']}",
+        f"Quantity: {order['origQty']}",
+    ]
     if 'price' in order:
-        print(f"Price: {order['price']}")
-    print("-" * 40)
-
-def main():
-    """Main entry point for the trading bot CLI."""
-    load_dotenv()
-    
-    api_key = os.getenv('BINANCE_API_KEY')
-    api_secret = os.getenv('BINANCE_API_SECRET')
-    
-    if not api_key or not api_secret:
-        print("❌ API credentials not found! Please add them to your .env file:")
-        print("BINANCE_API_KEY=your_api_key")
-        print("BINANCE_API_SECRET=your_api_secret")
-        return
-    
-    try:
-        bot = BasicBot(api_key, api_secret, testnet=True)
-    except Exception as e:
-        logger.error(f"Failed to create bot: {str(e)}")
-        print(f"❌ Initialization failed: {str(e)}")
-        return
+        lines.append(f"Price: {order['price']}")
+    lines.append("-" * 40)
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    parser = argparse.ArgumentParser(add_help=False)
-    parser.add_argument('--dry-run', action='store_true', help='Run in simulation mode without sending API requests')
-    known_args, remaining_argv = parser.parse_known_args()
-    dry_run_flag = known_args.dry_run
-
-    try:
-        bot.init_client(dry_run=dry_run_flag)
-    except Exception as e:
-        logger.error(f"Failed to initialize client: {e}")
-        print(f"❌ Initialization failed: {e}")
-        return
+def _build_balance(subparsers):
+    subparsers.add_parser('balance', help='Show account balance')
 
-    try:
-        market_order = MarketOrder(bot)
-        limit_order = LimitOrder(bot)
-        oco_order = OCOOrder(bot)
-        stop_limit_order = StopLimitOrder(bot)
-        twap_strategy = TWAPStrategy(bot)
-        grid_strategy = GridStrategy(bot)
-    except Exception as e:
-        logger.error(f"Failed to initialize order handlers: {str(e)}")
-        print(f"❌ Initialization failed: {str(e)}")
-        return
-
-    parser = argparse.ArgumentParser(description='Binance Futures Trading Bot')
-    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
-    
-    balance_parser = subparsers.add_parser('balance', help='Show account balance')
-    
+def _build_market(subparsers):
     market_parser = subparsers.add_parser('market', help='Place a market order')
     market_parser.add_argument('symbol', help='Trading pair symbol (e.g., BTCUSDT)')
     market_parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
     market_parser.add_argument('quantity', type=float, help='Order quantity')
-    
+
+def _build_limit(subparsers):
     limit_parser = subparsers.add_parser('limit', help='Place a limit order')
     limit_parser.add_argument('symbol', help='Trading pair symbol (e.g., BTCUSDT)')
     limit_parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
@@ -100,7 +65,8 @@ def main():
     limit_parser.add_argument('price', type=float, help='Limit price')
     limit_parser.add_argument('--time-in-force', choices=['GTC', 'IOC', 'FOK'], 
                              default='GTC', help='Time in force')
-    
+
+def _build_oco(subparsers):
     oco_parser = subparsers.add_parser('oco', help='Place an OCO order')
     oco_parser.add_argument('symbol', help='Trading pair symbol (e.g., BTCUSDT)')
     oco_parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
@@ -109,7 +75,8 @@ def main():
     oco_parser.add_argument('sl_price', type=float, help='Stop-loss trigger price')
     oco_parser.add_argument('entry_price', nargs='?', type=float, default=None,
                             help='Optional entry price to place a LIMIT entry order before TP/SL')
-    
+
+def _build_stop_limit(subparsers):
     stop_limit_parser = subparsers.add_parser('stop-limit', help='Place a stop-limit order')
     stop_limit_parser.add_argument('symbol', help='Trading pair symbol (e.g., BTCUSDT)')
     stop_limit_parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
@@ -118,7 +85,8 @@ def main():
     stop_limit_parser.add_argument('stop_price', type=float, help='Stop trigger price')
     stop_limit_parser.add_argument('--time-in-force', choices=['GTC', 'IOC', 'FOK'],
                                  default='GTC', help='Time in force')
-    
+
+def _build_twap(subparsers):
     twap_parser = subparsers.add_parser('twap', help='Execute TWAP strategy')
     twap_parser.add_argument('symbol', help='Trading pair symbol (e.g., BTCUSDT)')
     twap_parser.add_argument('side', choices=['buy', 'sell'], help='Order side')
@@ -127,28 +95,89 @@ def main():
     twap_parser.add_argument('duration_minutes', type=float, help='Duration in minutes')
     twap_parser.add_argument('--use-limit', action='store_true', help='Use limit orders instead of market')
     twap_parser.add_argument('--limit-price', type=float, help='Limit price (required if use-limit is set)')
-    
+
+def _build_grid(subparsers):
     grid_parser = subparsers.add_parser('grid', help='Execute grid trading strategy')
     grid_parser.add_argument('symbol', help='Trading pair symbol (e.g., BTCUSDT)')
     grid_parser.add_argument('upper_price', type=float, help='Upper price boundary')
     grid_parser.add_argument('lower_price', type=float, help='Lower price boundary')
     grid_parser.add_argument('num_grids', type=int, help='Number of grid levels')
     grid_parser.add_argument('quantity_per_grid', type=float, help='Order quantity per grid level')
-    
-    args = parser.parse_args(remaining_argv)
-    
+
+def _build_repl(subparsers):
+    subparsers.add_parser('repl', help='Start an interactive shell that reuses one client across commands')
+
+# Only the invoked subcommand's parser is built; help and unknown commands build all of them.
+SUBCOMMAND_BUILDERS = {
+    'market': _build_market,
+    'limit': _build_limit,
+    'oco': _build_oco,
+    'stop-limit': _build_stop_limit,
+    'twap': _build_twap,
+    'grid': _build_grid,
+    'repl': _build_repl,
+}
+
+# Handler class for each order subcommand as (module, attribute); imported only when the command runs.
+LAZY_HANDLERS = {
+    'market': ('src.market_order', 'MarketOrder'),
+    'limit': ('src.limit_order', 'LimitOrder'),
+    'oco': ('src.advance.oco', 'OCOOrder'),
+    'stop-limit': ('src.advance.stop_limit', 'StopLimitOrder'),
+    'twap': ('src.advance.twap', 'TWAPStrategy'),
+    'grid': ('src.advance.grid', 'GridStrategy'),
+}
+
+def load_handler(command: str, bot: BasicBot):
+    """Import the handler module for `command` on first use and return a new handler bound to `bot`."""
+    module_name, attr = LAZY_HANDLERS[command]
+    return getattr(importlib.import_module(module_name), attr)(bot)
+
+def build_parser(argv: List[str]) -> argparse.ArgumentParser:
+    """Return the CLI parser, built with only the subcommand named in `argv` when it is known."""
+    command = next((arg for arg in argv if not arg.startswith('-')), None)
+    return _get_parser(command if command == 'balance' or command in SUBCOMMAND_BUILDERS else None)
+
+@lru_cache(maxsize=None)
+def _get_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """Build (once per command) a parser holding `command`'s subparser, or all of them for None.
+
+    `balance` is always added since it is trivial, so a balance-only parser needs nothing else.
+    """
+    parser = argparse.ArgumentParser(description='Binance Futures Trading Bot')
+    parser.add_argument('--dry-run', action='store_true', help='Run in simulation mode without sending API requests')
+    parser.add_argument('--ws-orders', action='store_true',
+                        help='Submit orders over the WebSocket trading API (falls back to REST if it cannot connect)')
+    subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+
+    _build_balance(subparsers)
+    if command is None:
+        for build in SUBCOMMAND_BUILDERS.values():
+            build(subparsers)
+    elif command in SUBCOMMAND_BUILDERS:
+        SUBCOMMAND_BUILDERS[command](subparsers)
+    return parser
+
+def run_command(bot: BasicBot, parser: argparse.ArgumentParser, args: argparse.Namespace):
+    """Execute a parsed subcommand against an initialized bot.
+
+    Returns the handler for commands that leave work running in the
+    background (grid, oco) so the caller can stop() it later; otherwise None.
+    """
     try:
         if args.command == 'balance':
             display_balance(bot)
             return
             
         if args.command == 'market':
+            market_order = load_handler('market', bot)
             order = market_order.place_order(
                 args.symbol, args.side, args.quantity
             )
             display_order_info(order)
             
         elif args.command == 'limit':
+            limit_order = load_handler('limit', bot)
             order = limit_order.place_order(
                 args.symbol, args.side, args.quantity,
                 args.price, args.time_in_force
@@ -156,6 +185,7 @@ def main():
             display_order_info(order)
             
         elif args.command == 'oco':
+            oco_order = load_handler('oco', bot)
             if args.entry_price is not None:
                 orders = oco_order.place_oco_order(
                     args.symbol, args.side, args.quantity,
@@ -173,8 +203,10 @@ def main():
             for order_type, order in orders.items():
                 print(f"\n{order_type.upper()}:")
                 display_order_info(order)
+            return oco_order
                 
         elif args.command == 'stop-limit':
+            stop_limit_order = load_handler('stop-limit', bot)
             order = stop_limit_order.place_order(
                 args.symbol, args.side, args.quantity,
                 args.price, args.stop_price, args.time_in_force
@@ -185,7 +217,8 @@ def main():
             if args.use_limit and args.limit_price is None:
                 print("❌ Error: --limit-price is required when using --use-limit")
                 return
-                
+
+            twap_strategy = load_handler('twap', bot)
             orders = twap_strategy.execute_twap(
                 args.symbol, args.side, args.total_quantity,
                 args.num_chunks, args.duration_minutes,
@@ -199,6 +232,7 @@ def main():
                 display_order_info(order)
                 
         elif args.command == 'grid':
+            grid_strategy = load_handler('grid', bot)
             orders = grid_strategy.execute_grid(
                 args.symbol, args.upper_price, args.lower_price,
                 args.num_grids, args.quantity_per_grid
@@ -210,6 +244,7 @@ def main():
             for i, order in enumerate(orders, 1):
                 print(f"\nGrid Order {i}:")
                 display_order_info(order)
+            return grid_strategy
                 
         else:
             parser.print_help()
@@ -218,5 +253,123 @@ def main():
         logger.error(f"Error executing command: {str(e)}")
         print(f"❌ Error: {str(e)}")
 
+class BotShell(cmd.Cmd):
+    """Interactive shell that reuses one initialized bot for every command.
+
+    The client's HTTP connection pool and cached exchange info survive between
+    commands, and grid / OCO monitors keep running in the background until
+    `stop` or leaving the shell stops them.
+    """
+    intro = "Binance Futures Trading Bot shell. Type 'help' for commands, 'exit' to quit."
+    prompt = 'bot> '
+    # Command names such as `stop-limit` contain '-'; without it `stop-limit ...` would run do_stop.
+    identchars = cmd.Cmd.identchars + '-'
+
+    def __init__(self, bot: BasicBot):
+        super().__init__()
+        self.bot = bot
+        self._running: List[Any] = []
+
+    def default(self, line: str):
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            return
+        if argv[0] == 'repl':
+            print("Already in the interactive shell")
+            return
+        session_flags = SESSION_FLAGS.intersection(argv)
+        if session_flags:
+            print(f"❌ Error: {', '.join(sorted(session_flags))} must be given when starting the shell, "
+                  f"e.g. `python3 main.py --dry-run repl`")
+            return
+        parser = build_parser(argv)
+        try:
+            args = parser.parse_args(argv)
+        except SystemExit:
+            return
+        handler = run_command(self.bot, parser, args)
+        if handler is not None:
+            self._running.append(handler)
+
+    def do_help(self, arg: str):
+        if arg in ('stop', 'exit', 'quit'):
+            super().do_help(arg)
+            return
+        try:
+            build_parser([arg]).parse_args([arg, '--help'] if arg else ['--help'])
+        except SystemExit:
+            pass
+        if not arg:
+            print("\nShell commands: stop (stop background grid / OCO monitors), exit")
+
+    def do_stop(self, arg: str):
+        """Stop every grid / OCO monitor started from this shell (grid orders are cancelled)."""
+        if not self._running:
+            print("Nothing running")
+            return
+        while self._running:
+            handler = self._running.pop()
+            try:
+                handler.stop()
+            except Exception as e:
+                logger.error(f"Error stopping {type(handler).__name__}: {str(e)}")
+        print("Stopped all background strategies")
+
+    def do_exit(self, arg: str):
+        """Stop background strategies and leave the shell."""
+        if self._running:
+            self.do_stop('')
+        return True
+
+    do_quit = do_exit
+
+    def do_EOF(self, arg: str):
+        print()
+        return self.do_exit(arg)
+
+    def emptyline(self):
+        pass
+
+def main():
+    """Main entry point for the trading bot CLI."""
+    argv = sys.argv[1:]
+    parser = build_parser(argv)
+    args = parser.parse_args(argv)
+
+    if not os.getenv('BINANCE_API_KEY'):
+        from dotenv import load_dotenv
+        load_dotenv()
+    
+    api_key = os.getenv('BINANCE_API_KEY')
+    api_secret = os.getenv('BINANCE_API_SECRET')
+    
+    if not api_key or not api_secret:
+        print("❌ API credentials not found! Please add them to your .env file:")
+        print("BINANCE_API_KEY=your_api_key")
+        print("BINANCE_API_SECRET=your_api_secret")
+        return
+    
+    try:
+        bot = BasicBot(api_key, api_secret, testnet=True)
+    except Exception as e:
+        logger.error(f"Failed to create bot: {str(e)}")
+        print(f"❌ Initialization failed: {str(e)}")
+        return
+
+    try:
+        bot.init_client(dry_run=args.dry_run, ws_orders=args.ws_orders)
+    except Exception as e:
+        logger.error(f"Failed to initialize client: {e}")
+        print(f"❌ Initialization failed: {e}")
+        return
+
+    if args.command == 'repl':
+        BotShell(bot).cmdloop()
+        return
+
+    run_command(bot, parser, args)
+
 if __name__ == "__main__":
     main()
@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 
-import time
+from __future__ import annotations
+
 import threading
-from typing import Dict, Any, List, Optional
-from decimal import Decimal
-from src.common import BasicBot, logger
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Set, Tuple
+from src.common import BasicBot, LotSize, PriceFilter, PricePoint, UserDataStream, STREAM_CHECK_INTERVAL, logger
 from src.limit_order import LimitOrder
 from binance.exceptions import BinanceAPIException
 
+# Binance accepts at most 5 orders per POST /fapi/v1/batchOrders request.
+BATCH_ORDER_LIMIT = 5
+# Error codes for which a batch is retried as individual orders.
+BATCH_FALLBACK_CODES = (-1102, -4021)
+# Concurrent order requests when batches are unavailable; well inside the per-minute order limit.
+GRID_ORDER_WORKERS = 8
+# Binance cancels at most 10 orders per DELETE /fapi/v1/batchOrders request.
+CANCEL_BATCH_LIMIT = 10
+# Upper bound in seconds for the fallback poller's idle backoff.
+MAX_POLL_INTERVAL = 30
+
 class GridStrategy:
     def __init__(self, bot: BasicBot):
         """Initialize Grid Trading strategy handler."""
@@ -15,6 +27,13 @@ class GridStrategy:
         self.limit_order = LimitOrder(bot)
         self._stop_event = threading.Event()
         self._active_orders: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stream: Optional[UserDataStream] = None
+        # Fills the stream reports while orders are still being placed, before their ids are recorded.
+        self._placing = False
+        self._early_fills: Set[int] = set()
+        self._tick_size = 0.0
+        self._tick_step = 1
         
     def _validate_grid_params(self, upper_price: float, lower_price: float,
                           num_grids: int, quantity_per_grid: float) -> None:
@@ -27,44 +46,116 @@ class GridStrategy:
             raise ValueError("Quantity per grid must be positive")
             
     def _calculate_grid_levels(self, upper_price: float, lower_price: float,
-                           num_grids: int, symbol_info: Dict[str, Any]) -> List[float]:
-        """Calculate price levels for the grid."""
-        price_step = (upper_price - lower_price) / (num_grids - 1)
-        
-        tick_size = None
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'PRICE_FILTER':
-                tick_size = float(filter['tickSize'])
-                break
-                
-        if not tick_size:
+                           num_grids: int, price_filter: Optional[PriceFilter]) -> List[int]:
+        """Calculate grid levels as integer tick counts.
+
+        Also records the tick size and the per-level tick step, which
+        `_price_point` and replacement orders use to stay exactly on-tick.
+        """
+        if price_filter is None or not price_filter.tick_size:
             raise ValueError("Could not determine price tick size")
-            
-        levels = []
-        for i in range(num_grids):
-            price = lower_price + (i * price_step)
-            price = self.bot.round_step_size(price, tick_size)
-            levels.append(price)
-            
-        return levels
 
-    def _validate_quantity(self, symbol_info: Dict[str, Any],
-                       quantity_per_grid: float) -> float:
+        tick_size = self._tick_size = price_filter.tick_size
+        lower_ticks = round(lower_price / tick_size)
+        span_ticks = round(upper_price / tick_size) - lower_ticks
+        if span_ticks < num_grids - 1:
+            raise ValueError(
+                f"Price range {lower_price}-{upper_price} holds only {span_ticks} ticks; "
+                f"need at least {num_grids - 1} for {num_grids} grid levels"
+            )
+        self._tick_step = span_ticks // (num_grids - 1)
+
+        return [lower_ticks + i * self._tick_step for i in range(num_grids)]
+
+    def _price_point(self, ticks: int) -> PricePoint:
+        """Convert a tick count to the on-tick price sent to the API."""
+        return self.bot.round_price(ticks * self._tick_size, self._tick_size)
+
+    def _validate_quantity(self, lot: Optional[LotSize], quantity_per_grid: float) -> float:
         """Validate grid order quantity."""
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'LOT_SIZE':
-                min_qty = float(filter['minQty'])
-                max_qty = float(filter['maxQty'])
-                step_size = float(filter['stepSize'])
-                
-                if quantity_per_grid < min_qty:
-                    raise ValueError(f"Quantity {quantity_per_grid} below minimum {min_qty}")
-                if quantity_per_grid > max_qty:
-                    raise ValueError(f"Quantity {quantity_per_grid} above maximum {max_qty}")
-                
-                quantity_per_grid = self.bot.round_step_size(quantity_per_grid, step_size)
-                
-        return quantity_per_grid
+        if lot is None:
+            return quantity_per_grid
+        if quantity_per_grid < lot.min_qty:
+            raise ValueError(f"Quantity {quantity_per_grid} below minimum {lot.min_qty}")
+        if quantity_per_grid > lot.max_qty:
+            raise ValueError(f"Quantity {quantity_per_grid} above maximum {lot.max_qty}")
+        
+        return self.bot.round_step_size(quantity_per_grid, lot.step_size)
+
+    def _place_grid_orders(self, symbol: str, planned: List[Tuple[str, int]],
+                           quantity: float) -> List[Dict[str, Any]]:
+        """Place the planned (side, ticks) orders in batches of BATCH_ORDER_LIMIT."""
+        orders = []
+        start = 0
+        quantity_text = self.bot.format_quantity(symbol, quantity)
+        while start < len(planned):
+            batch = [
+                {
+                    'symbol': symbol,
+                    'side': side,
+                    'type': 'LIMIT',
+                    'timeInForce': 'GTC',
+                    'quantity': quantity_text,
+                    'price': self._price_point(ticks).text
+                }
+                for side, ticks in planned[start:start + BATCH_ORDER_LIMIT]
+            ]
+            try:
+                response = self.bot.client.futures_place_batch_order(batchOrders=batch)
+            except BinanceAPIException as e:
+                if e.code not in BATCH_FALLBACK_CODES:
+                    raise
+                logger.warning(f"Batch order rejected ({e.code}), placing grid orders one by one")
+                break
+
+            # Record every accepted order before reporting a rejection so stop() can cancel them.
+            rejected = [item for item in response if 'orderId' not in item]
+            with self._lock:
+                for item in response:
+                    if 'orderId' in item:
+                        orders.append(item)
+                        self._active_orders[item['orderId']] = item
+            if rejected:
+                raise RuntimeError(f"Batch grid order rejected: {rejected[0]}")
+            start += BATCH_ORDER_LIMIT
+
+        if start < len(planned):
+            orders.extend(self._place_orders_concurrently(symbol, planned[start:], quantity))
+
+        logger.info(f"Placed {len(orders)} grid orders")
+        return orders
+
+    def _place_orders_concurrently(self, symbol: str, planned: List[Tuple[str, int]],
+                                   quantity: float) -> List[Dict[str, Any]]:
+        """Place individual LIMIT orders with overlapping round-trips, preserving planned order.
+
+        Quantity and on-tick prices were validated in execute_grid, so orders
+        skip LimitOrder's per-call validation.
+        """
+        error = None
+        with ThreadPoolExecutor(max_workers=GRID_ORDER_WORKERS) as executor:
+            futures = [
+                executor.submit(
+                    self.limit_order._place_prevalidated,
+                    symbol, side, quantity, self._price_point(ticks)
+                )
+                for side, ticks in planned
+            ]
+            for future in as_completed(futures):
+                try:
+                    order = future.result()
+                except Exception as e:
+                    if error is None:
+                        error = e
+                        for pending in futures:
+                            pending.cancel()
+                    continue
+                with self._lock:
+                    self._active_orders[order['orderId']] = order
+
+        if error is not None:
+            raise error
+        return [future.result() for future in futures]
 
     def execute_grid(self, symbol: str, upper_price: float, lower_price: float,
                     num_grids: int, quantity_per_grid: float) -> List[Dict[str, Any]]:
@@ -83,59 +174,41 @@ class GridStrategy:
         """
         try:
             self._stop_event.clear()
-            self._active_orders.clear()
+            with self._lock:
+                self._active_orders.clear()
             
             self._validate_grid_params(upper_price, lower_price, num_grids, quantity_per_grid)
             symbol = symbol.upper()
             
-            if not self.bot.validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
-                
             symbol_info = self.bot.get_symbol_info(symbol)
-            if not symbol_info:
-                raise ValueError(f"Could not get symbol info for {symbol}")
+            if symbol_info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
             
-            price_levels = self._calculate_grid_levels(upper_price, lower_price, num_grids, symbol_info)
-            quantity_per_grid = self._validate_quantity(symbol_info, quantity_per_grid)
+            price_levels = self._calculate_grid_levels(
+                upper_price, lower_price, num_grids, symbol_info['_price_filter']
+            )
+            quantity_per_grid = self._validate_quantity(symbol_info['_lot_filter'], quantity_per_grid)
             
             logger.info(
                 f"Starting grid strategy: {symbol} with {num_grids} levels "
                 f"from {lower_price} to {upper_price}"
             )
             
-            orders = []
+            planned = []
             for i in range(len(price_levels) - 1):
-                try:
-                    buy_order = self.limit_order.place_order(
-                        symbol=symbol,
-                        side='BUY',
-                        quantity=quantity_per_grid,
-                        price=price_levels[i],
-                        time_in_force='GTC'
-                    )
-                    orders.append(buy_order)
-                    self._active_orders[buy_order['orderId']] = buy_order
-                    
-                    sell_order = self.limit_order.place_order(
-                        symbol=symbol,
-                        side='SELL',
-                        quantity=quantity_per_grid,
-                        price=price_levels[i + 1],
-                        time_in_force='GTC'
-                    )
-                    orders.append(sell_order)
-                    self._active_orders[sell_order['orderId']] = sell_order
-                    
-                except Exception as e:
-                    logger.error(f"Error placing grid orders: {str(e)}")
-                    self.stop()
-                    raise
+                planned.append(('BUY', price_levels[i]))
+                planned.append(('SELL', price_levels[i + 1]))
+
+            # Subscribe before any order exists so a level that fills right away is not missed.
+            self._start_stream(symbol)
+            try:
+                orders = self._place_grid_orders(symbol, planned, quantity_per_grid)
+            except Exception as e:
+                logger.error(f"Error placing grid orders: {str(e)}")
+                self.stop()
+                raise
             
-            monitor_thread = threading.Thread(
-                target=self._monitor_and_replace_orders,
-                args=(symbol,)
-            )
-            monitor_thread.start()
+            self._start_monitoring(symbol)
             
             return orders
             
@@ -143,57 +216,179 @@ class GridStrategy:
             logger.error(f"Grid strategy initialization failed: {str(e)}")
             raise
             
+    def _start_stream(self, symbol: str):
+        """Start listening for fills on the futures user data stream (not in dry-run)."""
+        with self._lock:
+            self._placing = True
+            self._early_fills.clear()
+        if self.bot.dry_run:
+            return
+        self._stream = UserDataStream(
+            self.bot,
+            on_order_update=self._on_order_update,
+            on_error=lambda: self._fall_back_to_polling(symbol)
+        )
+        try:
+            self._stream.start()
+        except Exception as e:
+            logger.error(f"Could not start user data stream, falling back to polling: {str(e)}")
+            self._stream = None
+
+    def _start_monitoring(self, symbol: str):
+        """Replace fills reported during placement, then follow the stream, or poll without one.
+
+        While the stream runs, a checker thread still verifies the orders over
+        REST every STREAM_CHECK_INTERVAL seconds.
+        """
+        with self._lock:
+            self._placing = False
+            filled = [self._active_orders.pop(i) for i in self._early_fills if i in self._active_orders]
+            self._early_fills.clear()
+            streaming = self._stream is not None
+        for order in filled:
+            logger.info("Grid order filled during placement: %s", order)
+            self._replace_filled_order(symbol, order)
+
+        if not streaming:
+            self._start_polling(symbol)
+            return
+        logger.info("Grid monitoring via futures user data stream")
+        threading.Thread(target=self._check_stream_orders, args=(symbol,), daemon=True).start()
+
+    def _start_polling(self, symbol: str):
+        monitor_thread = threading.Thread(
+            target=self._monitor_and_replace_orders,
+            args=(symbol,)
+        )
+        monitor_thread.start()
+
+    def _fall_back_to_polling(self, symbol: str):
+        """Switch to REST polling after the user data stream reports an error."""
+        with self._lock:
+            if self._stream is None or self._stop_event.is_set():
+                return
+            stream, self._stream = self._stream, None
+            # During placement _start_monitoring sees the missing stream and starts the poller.
+            poll = not self._placing
+        threading.Thread(target=stream.stop, daemon=True).start()
+        if poll:
+            self._start_polling(symbol)
+
+    def _on_order_update(self, update: Dict[str, Any]):
+        """Replace grid orders as the user data stream reports them FILLED."""
+        if self._stop_event.is_set() or update.get('X') != 'FILLED':
+            return
+        with self._lock:
+            order = self._active_orders.pop(update['i'], None)
+            if order is None and self._placing:
+                self._early_fills.add(update['i'])
+        if order is None:
+            return
+        logger.info("Grid order filled: %s", update)
+        self._replace_filled_order(update['s'], order)
+
+    def _replace_filled_order(self, symbol: str, order: Dict[str, Any]):
+        """Place the opposite-side order for a filled grid order."""
+        new_side = 'SELL' if order['side'] == 'BUY' else 'BUY'
+        ticks = round(float(order['price']) / self._tick_size)
+        ticks += self._tick_step if new_side == 'SELL' else -self._tick_step
+        
+        try:
+            new_order = self.limit_order._place_prevalidated(
+                symbol, new_side, float(order['origQty']), self._price_point(ticks)
+            )
+            with self._lock:
+                self._active_orders[new_order['orderId']] = new_order
+            logger.info("Placed replacement grid order: %s", new_order)
+            
+        except Exception as e:
+            logger.error(f"Error placing replacement order: {str(e)}")
+
     def _monitor_and_replace_orders(self, symbol: str):
-        """Monitor filled orders and replace them to maintain the grid."""
+        """Poll order status and replace filled orders (dry-run / no user data stream).
+
+        Polls again after 1s when something filled and backs off exponentially
+        up to MAX_POLL_INTERVAL while the grid is idle.
+        """
+        idle = 0
         while not self._stop_event.is_set():
             try:
-                for order_id, order in list(self._active_orders.items()):
-                    status = self.bot.client.futures_get_order(
-                        symbol=symbol,
-                        orderId=order_id
-                    )
-                    
-                    if status['status'] == 'FILLED':
-                        logger.info(f"Grid order filled: {status}")
-                        
-                        del self._active_orders[order_id]
-                        
-                        new_side = 'SELL' if order['side'] == 'BUY' else 'BUY'
-                        new_price = float(order['price']) * (1.01 if new_side == 'SELL' else 0.99)
-                        
-                        try:
-                            new_order = self.limit_order.place_order(
-                                symbol=symbol,
-                                side=new_side,
-                                quantity=float(order['origQty']),
-                                price=new_price,
-                                time_in_force='GTC'
-                            )
-                            self._active_orders[new_order['orderId']] = new_order
-                            logger.info(f"Placed replacement grid order: {new_order}")
-                            
-                        except Exception as e:
-                            logger.error(f"Error placing replacement order: {str(e)}")
-                
-                time.sleep(5)
+                saw_fill = self._check_orders(symbol)
+                if saw_fill:
+                    idle = 0
+                    delay = 1
+                else:
+                    idle += 1
+                    delay = min(MAX_POLL_INTERVAL, 2 ** idle)
+                self._stop_event.wait(delay)
                 
             except Exception as e:
                 logger.error(f"Error in grid monitor thread: {str(e)}")
-                if not self._stop_event.is_set():
-                    time.sleep(10)
+                self._stop_event.wait(10)
                     
-    def stop(self):
-        """Stop the grid strategy and cancel all active orders."""
-        self._stop_event.set()
-        
-        for order_id, order in self._active_orders.items():
+    def _check_stream_orders(self, symbol: str):
+        """Re-check orders over REST every STREAM_CHECK_INTERVAL seconds while the stream is in use."""
+        while not self._stop_event.wait(STREAM_CHECK_INTERVAL):
+            if self._stream is None:
+                return
             try:
-                self.bot.client.futures_cancel_order(
-                    symbol=order['symbol'],
-                    orderId=order_id
-                )
-                logger.info(f"Cancelled grid order: {order_id}")
+                self._check_orders(symbol)
             except Exception as e:
-                logger.error(f"Error cancelling order {order_id}: {str(e)}")
+                logger.error(f"Error re-checking grid orders: {str(e)}")
+
+    def _check_orders(self, symbol: str) -> bool:
+        """Query every active order once and replace the filled ones; True if any filled."""
+        saw_fill = False
+        with self._lock:
+            snapshot = tuple(self._active_orders.items())
+        for order_id, order in snapshot:
+            if self._stop_event.is_set():
+                break
+            status = self.bot.client.futures_get_order(
+                symbol=symbol,
+                orderId=order_id
+            )
+            
+            if status['status'] == 'FILLED':
+                logger.info("Grid order filled: %s", status)
+                
+                with self._lock:
+                    if self._active_orders.pop(order_id, None) is None:
+                        continue
+                saw_fill = True
+                self._replace_filled_order(symbol, order)
+        return saw_fill
+
+    def stop(self):
+        """Stop the grid strategy and cancel its active orders.
+
+        Only the orders this grid recorded are cancelled, so other strategies
+        trading the same symbol keep theirs.
+        """
+        self._stop_event.set()
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream = None
         
-        self._active_orders.clear()
\ No newline at end of file
+        by_symbol: Dict[str, List[int]] = {}
+        with self._lock:
+            for order_id, order in self._active_orders.items():
+                by_symbol.setdefault(order['symbol'], []).append(order_id)
+            self._active_orders.clear()
+
+        for symbol, order_ids in by_symbol.items():
+            for start in range(0, len(order_ids), CANCEL_BATCH_LIMIT):
+                chunk = order_ids[start:start + CANCEL_BATCH_LIMIT]
+                try:
+                    response = self.bot.client.futures_cancel_orders(symbol=symbol, orderidlist=chunk)
+                except Exception as e:
+                    logger.error(f"Error cancelling grid orders {chunk} for {symbol}: {str(e)}")
+                    continue
+                # Orders that filled or were cancelled meanwhile come back as per-item errors.
+                cancelled = 0
+                for item in response:
+                    if 'orderId' in item:
+                        cancelled += 1
+                    else:
+                        logger.error(f"Could not cancel grid order for {symbol}: {item}")
+                logger.info(f"Cancelled {cancelled} grid orders for {symbol}")
\ No newline at end of file
@@ -1,24 +1,37 @@
 #!/usr/bin/env python3
 
-import time
+import random
 import threading
-from typing import Dict, Any, Optional, Tuple
-from src.common import BasicBot, logger
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Set, Tuple
+from src.common import BasicBot, PricePoint, UserDataStream, STREAM_CHECK_INTERVAL, logger
 from binance.exceptions import BinanceAPIException
 
-POLL_INTERVAL = 2.0
+# REST polling backs off from POLL_BASE_INTERVAL to POLL_MAX_INTERVAL seconds while nothing changes.
+POLL_BASE_INTERVAL = 0.25
+POLL_MAX_INTERVAL = 5.0
+# Statuses after which an order can no longer fill.
+FINAL_ORDER_STATUSES = ('CANCELED', 'EXPIRED', 'REJECTED')
+
+def _poll_delay(attempt: int) -> float:
+    """Exponential backoff delay for the given attempt, with +/-20% jitter."""
+    return min(POLL_MAX_INTERVAL, POLL_BASE_INTERVAL * 2 ** attempt) * (0.8 + 0.4 * random.random())
 
 class OCOOrder:
     def __init__(self, bot: BasicBot):
         self.bot = bot
         self._monitoring = False
+        self._stop_event = threading.Event()
+        self._fill_cond = threading.Condition()
+        self._filled_ids: Set[int] = set()
+        self._stream_failed = False
         self.ORDER_TYPE_MARKET = 'MARKET'
         self.ORDER_TYPE_LIMIT = 'LIMIT'
         self.ORDER_TYPE_STOP_MARKET = 'STOP_MARKET'
         self.TIME_IN_FORCE_GTC = 'GTC'
 
     def _place_entry_order(self, symbol: str, side: str, quantity: float,
-                           entry_type: str = 'MARKET', entry_price: Optional[float] = None) -> Dict[str, Any]:
+                           entry_type: str = 'MARKET', entry_price: Optional[PricePoint] = None) -> Dict[str, Any]:
         try:
             params = {
                 'symbol': symbol,
@@ -29,58 +42,200 @@ class OCOOrder:
             if entry_type == self.ORDER_TYPE_LIMIT and entry_price is not None:
                 params.update({
                     'timeInForce': self.TIME_IN_FORCE_GTC,
-                    'price': str(entry_price)
+                    'price': entry_price.text
                 })
 
-            order = self.bot.client.futures_create_order(**params)
-            logger.info(f"Entry order placed: {order}")
+            order = self.bot.create_order(**params)
+            logger.info("Entry order placed: %s", order)
             return order
         except BinanceAPIException as e:
             logger.error(f"Entry order failed: {e}")
             raise
 
+    def _to_price_point(self, symbol_info: Dict[str, Any], price: float) -> PricePoint:
+        """Round `price` to the symbol's tick so the API gets a canonical price string."""
+        pf = symbol_info['_price_filter']
+        if pf is None:
+            return PricePoint(price, str(price))
+        return self.bot.round_price(price, pf.tick_size)
+
+    def _wait_for_entry_fill(self, symbol: str, order_id: int,
+                             stream: Optional[UserDataStream] = None) -> bool:
+        """Wait for the LIMIT entry to fill; False if stop() was called or the entry closed unfilled.
+
+        With a user data stream the wait wakes as soon as the fill is pushed;
+        REST is polled only without a stream or after it fails.
+        """
+        if stream is not None:
+            if self._wait_for_stream_fill(symbol, (order_id,)) is not None:
+                return True
+            if self._stop_event.is_set():
+                return False
+        attempt, last_state = 0, None
+        while not self._stop_event.is_set():
+            st = self.bot.client.futures_get_order(symbol=symbol, orderId=order_id)
+            if st.get('status') == 'FILLED':
+                return True
+            if st.get('status') in FINAL_ORDER_STATUSES:
+                logger.info('OCO entry order %s is %s', order_id, st['status'])
+                return False
+            state = (st.get('status'), st.get('executedQty'))
+            attempt = 0 if state != last_state else attempt + 1
+            last_state = state
+            self._stop_event.wait(_poll_delay(attempt))
+        return False
+
     def _place_tp_sl_orders(self, symbol: str, side: str, quantity: float,
-                             tp_price: float, sl_price: float) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+                             tp_price: PricePoint, sl_price: PricePoint) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         exit_side = 'SELL' if side == 'BUY' else 'BUY'
+        tp_params = {
+            'symbol': symbol,
+            'side': exit_side,
+            'type': self.ORDER_TYPE_LIMIT,
+            'timeInForce': self.TIME_IN_FORCE_GTC,
+            'quantity': quantity,
+            'price': tp_price.text
+        }
+        sl_params = {
+            'symbol': symbol,
+            'side': exit_side,
+            'type': self.ORDER_TYPE_STOP_MARKET,
+            'stopPrice': sl_price.text,
+            'quantity': quantity
+        }
+
+        # The two legs are independent, so both requests are in flight at once.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            tp_future = executor.submit(self.bot.create_order, **tp_params)
+            sl_future = executor.submit(self.bot.create_order, **sl_params)
+        tp_error = tp_future.exception()
+        sl_error = sl_future.exception()
+
+        if tp_error is not None or sl_error is not None:
+            # Never leave a lone exit armed: cancel whichever leg did get placed.
+            for future in (tp_future, sl_future):
+                if future.exception() is None:
+                    self._cancel_leg(symbol, future.result()['orderId'])
+            error = tp_error if tp_error is not None else sl_error
+            logger.error(f"Failed to place TP/SL orders: {error}")
+            raise error
+
+        tp_order = tp_future.result()
+        sl_order = sl_future.result()
 
-        tp_order = self.bot.client.futures_create_order(
-            symbol=symbol,
-            side=exit_side,
-            type=self.ORDER_TYPE_LIMIT,
-            timeInForce=self.TIME_IN_FORCE_GTC,
-            quantity=quantity,
-            price=str(tp_price)
-        )
-
-        sl_order = self.bot.client.futures_create_order(
-            symbol=symbol,
-            side=exit_side,
-            type=self.ORDER_TYPE_STOP_MARKET,
-            stopPrice=str(sl_price),
-            quantity=quantity
-        )
-
-        logger.info(f"TP order: {tp_order}")
-        logger.info(f"SL order: {sl_order}")
+        logger.info("TP order: %s", tp_order)
+        logger.info("SL order: %s", sl_order)
         return tp_order, sl_order
 
-    def _monitor_orders(self, symbol: str, tp_order_id: int, sl_order_id: int):
+    def _cancel_leg(self, symbol: str, order_id: int):
+        try:
+            self.bot.client.futures_cancel_order(symbol=symbol, orderId=order_id)
+            logger.info(f"Cancelled OCO leg {order_id} after the other leg failed")
+        except Exception as e:
+            logger.error(f"Could not cancel OCO leg {order_id}: {e}")
+
+    def _start_stream(self) -> Optional[UserDataStream]:
+        """Start recording order fills from the user data stream; None in dry-run or if it fails."""
+        with self._fill_cond:
+            self._filled_ids.clear()
+            self._stream_failed = False
+        if self.bot.dry_run:
+            return None
+        stream = UserDataStream(self.bot, on_order_update=self._on_order_update,
+                                on_error=self._on_stream_error)
+        try:
+            stream.start()
+            return stream
+        except Exception as e:
+            logger.error(f"Could not start user data stream, OCO will poll: {e}")
+            return None
+
+    def _on_order_update(self, update: Dict[str, Any]):
+        if update.get('X') == 'FILLED':
+            with self._fill_cond:
+                self._filled_ids.add(update['i'])
+                self._fill_cond.notify_all()
+
+    def _on_stream_error(self):
+        with self._fill_cond:
+            self._stream_failed = True
+            self._fill_cond.notify_all()
+
+    def _wait_for_stream_fill(self, symbol: str, order_ids: Tuple[int, ...]) -> Optional[int]:
+        """Block until the stream reports one of `order_ids` filled.
+
+        Every STREAM_CHECK_INTERVAL seconds without news the orders are checked
+        over REST. Returns None if the stream failed, stop() was called, or an
+        order left the book without filling; callers then fall back to polling.
+        """
+        while True:
+            with self._fill_cond:
+                self._fill_cond.wait_for(
+                    lambda: self._stream_failed or self._stop_event.is_set()
+                    or any(i in self._filled_ids for i in order_ids),
+                    timeout=STREAM_CHECK_INTERVAL
+                )
+                filled_id = next((i for i in order_ids if i in self._filled_ids), None)
+                if filled_id is not None or self._stream_failed or self._stop_event.is_set():
+                    return filled_id
+            for order_id in order_ids:
+                try:
+                    status = self.bot.client.futures_get_order(symbol=symbol, orderId=order_id).get('status')
+                except Exception as e:
+                    logger.error(f"REST check of order {order_id} failed: {e}")
+                    continue
+                if status == 'FILLED':
+                    logger.info('Order %s filled without a stream event', order_id)
+                    return order_id
+                if status in FINAL_ORDER_STATUSES:
+                    return None
+
+    def _poll_for_fill(self, symbol: str, tp_order_id: int, sl_order_id: int) -> Optional[int]:
+        """REST fallback: poll until TP or SL fills.
+
+        Each tick makes one open-orders query for both legs; a leg is fetched
+        individually only once it has left the book, to tell FILLED from CANCELED.
+        Returns None if stopped or if both legs ended without filling.
+        """
+        closed: Set[int] = set()
+        attempt, last_state = 0, None
+        while not self._stop_event.is_set():
+            open_ids = {o['orderId'] for o in self.bot.client.futures_get_open_orders(symbol=symbol)}
+            for order_id in (tp_order_id, sl_order_id):
+                if order_id in open_ids or order_id in closed:
+                    continue
+                status = self.bot.client.futures_get_order(symbol=symbol, orderId=order_id).get('status')
+                if status == 'FILLED':
+                    return order_id
+                if status in FINAL_ORDER_STATUSES:
+                    closed.add(order_id)
+            if len(closed) == 2:
+                logger.info('OCO legs closed without a fill; monitoring stopped')
+                return None
+
+            state = (tp_order_id in open_ids, sl_order_id in open_ids, len(closed))
+            attempt = 0 if state != last_state else attempt + 1
+            last_state = state
+            self._stop_event.wait(_poll_delay(attempt))
+        return None
+
+    def _monitor_orders(self, symbol: str, tp_order_id: int, sl_order_id: int,
+                        stream: Optional[UserDataStream] = None):
         self._monitoring = True
         try:
-            while self._monitoring:
-                tp_status = self.bot.client.futures_get_order(symbol=symbol, orderId=tp_order_id)
-                sl_status = self.bot.client.futures_get_order(symbol=symbol, orderId=sl_order_id)
-
-                if tp_status.get('status') == 'FILLED':
-                    self.bot.client.futures_cancel_order(symbol=symbol, orderId=sl_order_id)
-                    logger.info('TP filled; cancelled SL')
-                    break
-                if sl_status.get('status') == 'FILLED':
-                    self.bot.client.futures_cancel_order(symbol=symbol, orderId=tp_order_id)
-                    logger.info('SL filled; cancelled TP')
-                    break
-
-                time.sleep(POLL_INTERVAL)
+            filled_id = None
+            if stream is not None:
+                filled_id = self._wait_for_stream_fill(symbol, (tp_order_id, sl_order_id))
+                stream.stop()
+            if filled_id is None and not self._stop_event.is_set():
+                filled_id = self._poll_for_fill(symbol, tp_order_id, sl_order_id)
+
+            if filled_id == tp_order_id:
+                self.bot.client.futures_cancel_order(symbol=symbol, orderId=sl_order_id)
+                logger.info('TP filled; cancelled SL')
+            elif filled_id == sl_order_id:
+                self.bot.client.futures_cancel_order(symbol=symbol, orderId=tp_order_id)
+                logger.info('SL filled; cancelled TP')
         except Exception as e:
             logger.error(f"Error monitoring OCO orders: {e}")
         finally:
@@ -89,35 +244,51 @@ class OCOOrder:
     def place_oco_order(self, symbol: str, side: str, quantity: float,
                         tp_price: float, sl_price: float,
                         entry_type: str = 'MARKET', entry_price: Optional[float] = None) -> Dict[str, Any]:
+        self._stop_event.clear()
         symbol = symbol.upper()
         side = self.bot.format_side(side)
 
-        if not self.bot.validate_symbol(symbol):
+        symbol_info = self.bot.get_symbol_info(symbol)
+        if symbol_info is None:
             raise ValueError(f"Invalid symbol: {symbol}")
 
-        symbol_info = self.bot.get_symbol_info(symbol)
-        if not symbol_info:
-            raise ValueError(f"Could not retrieve symbol info for {symbol}")
+        tp_point = self._to_price_point(symbol_info, tp_price)
+        sl_point = self._to_price_point(symbol_info, sl_price)
+        if entry_price is not None:
+            entry_price = self._to_price_point(symbol_info, entry_price)
 
-        entry = self._place_entry_order(symbol, side, quantity, entry_type, entry_price)
+        # Subscribe before any order exists so a fill right after placement is not missed.
+        stream = self._start_stream()
+        try:
+            entry = self._place_entry_order(symbol, side, quantity, entry_type, entry_price)
 
-        if entry_type == self.ORDER_TYPE_LIMIT:
-            while True:
-                st = self.bot.client.futures_get_order(symbol=symbol, orderId=entry['orderId'])
-                if st.get('status') == 'FILLED':
-                    break
-                time.sleep(POLL_INTERVAL)
+            if (entry_type == self.ORDER_TYPE_LIMIT
+                    and not self._wait_for_entry_fill(symbol, entry['orderId'], stream)):
+                logger.info('OCO entry order did not fill; TP/SL not placed')
+                if stream is not None:
+                    stream.stop()
+                return {'entry': entry}
 
-        tp_order, sl_order = self._place_tp_sl_orders(symbol, side, quantity, tp_price, sl_price)
+            tp_order, sl_order = self._place_tp_sl_orders(symbol, side, quantity, tp_point, sl_point)
+        except Exception:
+            if stream is not None:
+                stream.stop()
+            raise
 
         try:
             monitor_thread = threading.Thread(
                 target=self._monitor_orders,
-                args=(symbol, tp_order['orderId'], sl_order['orderId']),
+                args=(symbol, tp_order['orderId'], sl_order['orderId'], stream),
                 daemon=True
             )
             monitor_thread.start()
         except Exception as e:
             logger.error(f"Failed to start OCO monitor thread: {e}")
 
-        return {'entry': entry, 'tp': tp_order, 'sl': sl_order}
\ No newline at end of file
+        return {'entry': entry, 'tp': tp_order, 'sl': sl_order}
+
+    def stop(self):
+        """Stop waiting for the entry fill or monitoring TP/SL (can be called from another thread)."""
+        self._stop_event.set()
+        with self._fill_cond:
+            self._fill_cond.notify_all()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from decimal import Decimal
-from src.common import BasicBot, logger
+from src.common import BasicBot, PricePoint, logger
 from binance.exceptions import BinanceAPIException
 
 class StopLimitOrder:
@@ -12,46 +12,54 @@ class StopLimitOrder:
         self.ORDER_TYPE_STOP = 'STOP'
         self.ORDER_TYPE_STOP_LIMIT = 'STOP_LIMIT'
 
-    def _validate_price(self, symbol_info: Dict[str, Any], price: float, stop_price: float) -> tuple[float, float]:
+    def _validate_price(self, symbol_info: Dict[str, Any], price: float,
+                        stop_price: float) -> Tuple[PricePoint, PricePoint]:
         """Validate both limit price and stop price."""
         if price <= 0 or stop_price <= 0:
             raise ValueError("Price and stop price must be positive")
             
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'PRICE_FILTER':
-                min_price = float(filter['minPrice'])
-                max_price = float(filter['maxPrice'])
-                tick_size = float(filter['tickSize'])
-                
-                if price < min_price or stop_price < min_price:
-                    raise ValueError(f"Price {min(price, stop_price)} below minimum {min_price}")
-                if price > max_price or stop_price > max_price:
-                    raise ValueError(f"Price {max(price, stop_price)} above maximum {max_price}")
-                
-                price = self.bot.round_step_size(price, tick_size)
-                stop_price = self.bot.round_step_size(stop_price, tick_size)
-                
-        return price, stop_price
+        pf = symbol_info['_price_filter']
+        if pf is None:
+            return PricePoint(price, str(price)), PricePoint(stop_price, str(stop_price))
+        if price < pf.min_price or stop_price < pf.min_price:
+            raise ValueError(f"Price {min(price, stop_price)} below minimum {pf.min_price}")
+        if price > pf.max_price or stop_price > pf.max_price:
+            raise ValueError(f"Price {max(price, stop_price)} above maximum {pf.max_price}")
+        
+        return (self.bot.round_price(price, pf.tick_size),
+                self.bot.round_price(stop_price, pf.tick_size))
 
     def _validate_quantity(self, symbol_info: Dict[str, Any], quantity: float) -> float:
         """Validate order quantity."""
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
             
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'LOT_SIZE':
-                min_qty = float(filter['minQty'])
-                max_qty = float(filter['maxQty'])
-                step_size = float(filter['stepSize'])
-                
-                if quantity < min_qty:
-                    raise ValueError(f"Quantity {quantity} below minimum {min_qty}")
-                if quantity > max_qty:
-                    raise ValueError(f"Quantity {quantity} above maximum {max_qty}")
-                
-                quantity = self.bot.round_step_size(quantity, step_size)
-                
-        return quantity
+        lot = symbol_info['_lot_filter']
+        if lot is None:
+            return quantity
+        if quantity < lot.min_qty:
+            raise ValueError(f"Quantity {quantity} below minimum {lot.min_qty}")
+        if quantity > lot.max_qty:
+            raise ValueError(f"Quantity {quantity} above maximum {lot.max_qty}")
+        
+        return self.bot.round_step_size(quantity, lot.step_size)
+
+    def _place_prevalidated(self, symbol: str, side: str, quantity: float, price: PricePoint,
+                            stop_price: PricePoint, time_in_force: str = 'GTC') -> Dict[str, Any]:
+        """Submit a stop-limit order whose inputs are already normalized; no validation or error handling."""
+        order = self.bot.create_order(
+            symbol=symbol,
+            side=side,
+            type='STOP',
+            timeInForce=time_in_force,
+            quantity=quantity,
+            price=price.text,
+            stopPrice=stop_price.text,
+            workingType='MARK_PRICE'
+        )
+        
+        logger.info("Stop-limit order placed successfully: %s", order)
+        return order
 
     def place_order(self, symbol: str, side: str, quantity: float, 
                    price: float, stop_price: float,
@@ -72,12 +80,9 @@ class StopLimitOrder:
         """
         try:
             symbol = symbol.upper()
-            if not self.bot.validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
-                
             symbol_info = self.bot.get_symbol_info(symbol)
-            if not symbol_info:
-                raise ValueError(f"Could not get symbol info for {symbol}")
+            if symbol_info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
             
             side = self.bot.format_side(side)
             quantity = self._validate_quantity(symbol_info, quantity)
@@ -87,19 +92,7 @@ class StopLimitOrder:
             if time_in_force not in ['GTC', 'IOC', 'FOK']:
                 raise ValueError("Time in force must be 'GTC', 'IOC', or 'FOK'")
             
-            order = self.bot.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type='STOP',
-                timeInForce=time_in_force,
-                quantity=quantity,
-                price=str(price),
-                stopPrice=str(stop_price),
-                workingType='MARK_PRICE'
-            )
-            
-            logger.info(f"Stop-limit order placed successfully: {order}")
-            return order
+            return self._place_prevalidated(symbol, side, quantity, price, stop_price, time_in_force)
             
         except BinanceAPIException as e:
             logger.error(f"Binance API error placing stop-limit order: {str(e)}")
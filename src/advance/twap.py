@@ -8,6 +8,10 @@ from src.market_order import MarketOrder
 from src.limit_order import LimitOrder
 from binance.exceptions import BinanceAPIException
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Chunk orders that may be in flight at once when the exchange is slower than the interval.
+TWAP_ORDER_WORKERS = 4
 
 class TWAPStrategy:
     def __init__(self, bot: BasicBot):
@@ -32,20 +36,41 @@ class TWAPStrategy:
         """Calculate and validate individual chunk size."""
         chunk_size = total_quantity / num_chunks
         
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'LOT_SIZE':
-                min_qty = float(filter['minQty'])
-                step_size = float(filter['stepSize'])
-                
-                if chunk_size < min_qty:
-                    raise ValueError(
-                        f"Chunk size {chunk_size} below minimum {min_qty}. "
-                        "Try fewer chunks or larger total quantity."
-                    )
-                
-                chunk_size = self.bot.round_step_size(chunk_size, step_size)
-                
-        return chunk_size
+        lot = symbol_info['_lot_filter']
+        if lot is None:
+            return chunk_size
+        if chunk_size < lot.min_qty:
+            raise ValueError(
+                f"Chunk size {chunk_size} below minimum {lot.min_qty}. "
+                "Try fewer chunks or larger total quantity."
+            )
+        if chunk_size > lot.max_qty:
+            raise ValueError(
+                f"Chunk size {chunk_size} above maximum {lot.max_qty}. "
+                "Try more chunks or smaller total quantity."
+            )
+        
+        return self.bot.round_step_size(chunk_size, lot.step_size)
+
+    def _place_chunk(self, chunk_number: int, symbol: str, side: str, quantity: float,
+                     use_limit_orders: bool, limit_price: Optional[float]) -> Dict[str, Any]:
+        """Place a single TWAP chunk order; inputs were validated once in execute_twap."""
+        try:
+            if use_limit_orders:
+                order = self.limit_order._place_prevalidated(symbol, side, quantity, limit_price)
+            else:
+                order = self.market_order._place_prevalidated(symbol, side, quantity)
+        except Exception as e:
+            logger.error(f"Error executing TWAP chunk {chunk_number}: {str(e)}")
+            raise
+        
+        logger.info("TWAP chunk %d executed: %s", chunk_number, order)
+        return order
+
+    def _on_chunk_done(self, future: Future) -> None:
+        """Wake the scheduling loop as soon as a chunk fails; its error is raised with the results."""
+        if future.exception() is not None:
+            self._stop_event.set()
 
     def execute_twap(self, symbol: str, side: str, total_quantity: float,
                     num_chunks: int, duration_minutes: float,
@@ -75,17 +100,16 @@ class TWAPStrategy:
             if use_limit_orders and limit_price is None:
                 raise ValueError("limit_price is required when use_limit_orders=True")
             
-            if not self.bot.validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
-                
             symbol_info = self.bot.get_symbol_info(symbol)
-            if not symbol_info:
-                raise ValueError(f"Could not get symbol info for {symbol}")
+            if symbol_info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
             
             chunk_size = self._calculate_chunk_size(total_quantity, num_chunks, symbol_info)
+            if use_limit_orders:
+                limit_price = self.limit_order._validate_price(symbol_info, limit_price)
             interval_seconds = (duration_minutes * 60) / num_chunks
             
-            orders = []
+            submitted = []
             remaining_chunks = num_chunks
             
             logger.info(
@@ -93,38 +117,25 @@ class TWAPStrategy:
                 f"in {num_chunks} chunks over {duration_minutes} minutes"
             )
             
-            while remaining_chunks > 0 and not self._stop_event.is_set():
-                chunk_start = time.time()
-                
-                try:
-                    if use_limit_orders:
-                        order = self.limit_order.place_order(
-                            symbol=symbol,
-                            side=side,
-                            quantity=chunk_size,
-                            price=limit_price,
-                            time_in_force='GTC'
-                        )
-                    else:
-                        order = self.market_order.place_order(
-                            symbol=symbol,
-                            side=side,
-                            quantity=chunk_size
-                        )
-                    
-                    orders.append(order)
-                    logger.info(f"TWAP chunk {num_chunks - remaining_chunks + 1} executed: {order}")
+            # Chunks are submitted in the background so a slow order round-trip
+            # overlaps the interval wait instead of delaying the next chunk.
+            # Chunk i is due at start + i * interval, so waits never accumulate drift.
+            start = time.monotonic()
+            with ThreadPoolExecutor(max_workers=TWAP_ORDER_WORKERS) as executor:
+                while remaining_chunks > 0 and not self._stop_event.is_set():
+                    future = executor.submit(
+                        self._place_chunk, num_chunks - remaining_chunks + 1,
+                        symbol, side, chunk_size, use_limit_orders, limit_price
+                    )
+                    future.add_done_callback(self._on_chunk_done)
+                    submitted.append(future)
+                    remaining_chunks -= 1
                     
-                except Exception as e:
-                    logger.error(f"Error executing TWAP chunk: {str(e)}")
-                    raise
-                
-                remaining_chunks -= 1
-                
-                if remaining_chunks > 0:
-                    elapsed = time.time() - chunk_start
-                    sleep_time = max(0, interval_seconds - elapsed)
-                    time.sleep(sleep_time)
+                    if remaining_chunks > 0:
+                        next_due = start + len(submitted) * interval_seconds
+                        self._stop_event.wait(max(0, next_due - time.monotonic()))
+            
+            orders = [future.result() for future in submitted]
             
             if self._stop_event.is_set():
                 logger.info("TWAP execution stopped by user")
@@ -1,31 +1,113 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import json
+import math
+import hmac
+import hashlib
+import atexit
 import logging
-from typing import Dict, Any, Optional, List
-from decimal import Decimal, ROUND_DOWN
-from dotenv import load_dotenv
+import logging.handlers
+import queue
+import asyncio
+import tempfile
+import threading
+from typing import Dict, Any, Optional, List, Set, Tuple, FrozenSet, Callable, NamedTuple
+from decimal import Decimal
+from concurrent.futures import Future, ThreadPoolExecutor
 from binance.client import Client
-from binance.exceptions import BinanceAPIException
+from binance.exceptions import BinanceAPIException, BinanceWebsocketUnableToConnect
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from typing import Union
 
 LOG_FILE = os.path.join(os.getcwd(), 'bot.log')
-logging.basicConfig(
-    filename=LOG_FILE,
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+
+# Order threads only enqueue records; a listener thread formats them and does the file I/O.
+_log_file_handler = logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3)
+_log_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_queue: 'queue.SimpleQueue[logging.LogRecord]' = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+# Merge args into the message before enqueueing; the file handler adds time and level.
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=LOG_LEVEL, handlers=[_log_queue_handler])
 logger = logging.getLogger('binance_bot')
 
+# exchangeInfo is ~500KB and its filters rarely change, so it is kept on disk between runs.
+EXCHANGE_INFO_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'binance-bot')
+EXCHANGE_INFO_CACHE_TTL = 24 * 60 * 60
+# Key under which the cached payload keeps the HTTP validators used to revalidate it.
+EXCHANGE_INFO_VALIDATORS_KEY = '_http_validators'
+# Binance error code for an unknown or delisted symbol.
+INVALID_SYMBOL_CODE = -1121
+# Binance error code for an order lookup that matches no order.
+ORDER_NOT_FOUND_CODE = -2013
+# Order types python-binance routes to the algo-order endpoint, which takes clientAlgoId
+# instead of newClientOrderId.
+CONDITIONAL_ORDER_TYPES = frozenset(('STOP', 'STOP_MARKET', 'TAKE_PROFIT', 'TAKE_PROFIT_MARKET', 'TRAILING_STOP_MARKET'))
+# Strategies driven by the user data stream re-check their orders over REST this often (seconds)
+# in case a fill event was lost or the stream went quiet without reporting an error.
+STREAM_CHECK_INTERVAL = 30.0
+
+class PricePoint(NamedTuple):
+    """A price rounded to its tick together with the canonical string sent to the API."""
+    value: float
+    text: str
+
+class LotSize:
+    """Parsed LOT_SIZE filter of a symbol; `decimals` is the step's decimal places."""
+    __slots__ = ('min_qty', 'max_qty', 'step_size', 'decimals')
+
+    def __init__(self, min_qty: float, max_qty: float, step_size: float, decimals: int):
+        self.min_qty = min_qty
+        self.max_qty = max_qty
+        self.step_size = step_size
+        self.decimals = decimals
+
+class PriceFilter:
+    """Parsed PRICE_FILTER of a symbol."""
+    __slots__ = ('min_price', 'max_price', 'tick_size')
+
+    def __init__(self, min_price: float, max_price: float, tick_size: float):
+        self.min_price = min_price
+        self.max_price = max_price
+        self.tick_size = tick_size
+
+class SymbolHandle:
+    """A symbol resolved once: interned upper-case name and its LOT_SIZE filter.
+
+    `market_orders` holds the constant part of a MARKET order's parameters per
+    side, so only the quantity is filled in per order.
+    """
+    __slots__ = ('symbol', 'lot', 'market_orders')
+
+    def __init__(self, symbol: str, lot: Optional[LotSize]):
+        self.symbol = symbol
+        self.lot = lot
+        self.market_orders = {
+            side: {'symbol': symbol, 'side': side, 'type': 'MARKET'} for side in ('BUY', 'SELL')
+        }
+
+_SIDE_MAP = {'buy': 'BUY', 'sell': 'SELL', 'BUY': 'BUY', 'SELL': 'SELL'}
+
 class BasicBot:
+    # Seconds an in-process copy of exchange info is reused before reloading it.
+    _EXCHANGE_INFO_TTL = 300
+
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
         """Initialize the trading bot.
 
         Supports dry-run mode by setting `dry_run=True` when creating the bot.
         """
         self.dry_run = False
-        self.client: Union[Client, DummyClient, None] = None
+        self.ws_orders = False
+        self.client: Union[SigningClient, DummyClient, None] = None
         if api_key and api_secret:
             self._api_key = api_key
             self._api_secret = api_secret
@@ -33,29 +115,151 @@ class BasicBot:
             self._api_key = None
             self._api_secret = None
         self.testnet = testnet
+        self._exchange_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._symbols_set: FrozenSet[str] = frozenset()
+        self._symbols_by_name: Dict[str, Dict[str, Any]] = {}
+        self._step_params: Dict[float, Tuple[float, int]] = {}
+        self._symbol_handles: Dict[str, SymbolHandle] = {}
+        self._bad_symbols: Set[str] = set()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._ws_executor: Optional[ThreadPoolExecutor] = None
         logger.info("BasicBot created (client not yet initialized)")
 
-    def init_client(self, dry_run: bool = False):
-        """Initialize the real or dummy client based on dry_run flag."""
+    def init_client(self, dry_run: bool = False, ws_orders: bool = False):
+        """Initialize the real or dummy client based on dry_run flag.
+
+        With `ws_orders`, `create_order` submits over the WebSocket trading API
+        (ignored in dry-run).
+        """
         self.dry_run = dry_run
+        self.ws_orders = ws_orders and not dry_run
+        self._exchange_info_cache = None
         if dry_run:
             self.client = DummyClient()
             logger.info("Initialized DummyClient for dry-run mode")
+            self._start_exchange_info_refresh()
             return
-        self.client = Client(self._api_key, self._api_secret)
+        # No constructor ping: it would open a spot-API connection on the default adapter, which is
+        # replaced below. The credential check further down warms the pooled futures connection instead.
+        # `testnet` must reach the constructor: it is where python-binance picks the ws-fapi endpoint.
+        self.client = SigningClient(self._api_key, self._api_secret, testnet=self.testnet, ping=False)
+        # Reuse keep-alive connections so only the first request pays for the TLS handshake.
+        # Retry only covers idempotent methods (urllib3's default), so orders are never resubmitted;
+        # the final error response still reaches python-binance for its normal exception handling.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.client.session.mount('https://', adapter)
+        self.client.session.headers['Connection'] = 'keep-alive'
         if self.testnet:
             self.client.API_URL = 'https://testnet.binance.vision/api'
             self.client.FUTURES_API_URL = 'https://testnet.binance.vision/fapi'
             self.client.FUTURES_URL = 'https://testnet.binance.vision'
             self.client.tld = 'vision'
-            self.client.testnet = True
+        if self.ws_orders:
+            # python-binance runs each WebSocket request on the calling thread's event loop, but the
+            # connection reads replies on the loop it was created with; a caller on any other loop
+            # gets its order sent and then times out. One thread running that loop submits them all.
+            self._ws_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='ws-orders',
+                initializer=asyncio.set_event_loop, initargs=(self.client.ws_future._loop,)
+            )
         logger.info("Real Binance client initialized")
         try:
             self.client.futures_account_balance()
         except Exception as e:
             logger.error(f"API credential/permission check failed: {e}")
             raise
+        self._start_exchange_info_refresh()
+
+    def _start_exchange_info_refresh(self):
+        """Preload exchange info in the background so the first order does not pay for the fetch."""
+        if self._refresh_thread is not None:
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_exchange_info_loop, daemon=True)
+        self._refresh_thread.start()
 
+    def _refresh_exchange_info_loop(self):
+        """Load exchange info now, then reload it every _EXCHANGE_INFO_TTL seconds."""
+        while True:
+            try:
+                self._get_exchange_info(force=True)
+            except Exception as e:
+                logger.error(f'Exchange info refresh failed: {e}')
+            time.sleep(self._EXCHANGE_INFO_TTL)
+
+    def create_order(self, **params) -> Dict[str, Any]:
+        """Submit a futures order; every order handler places orders through here.
+
+        Uses the persistent WebSocket trading connection when enabled; all WebSocket
+        submissions run on one dedicated thread so they share its event loop.
+        python-binance raises BinanceWebsocketUnableToConnect both for connection
+        failures and for requests that timed out after being sent, so the order gets
+        its client order id before the WebSocket attempt. On such a failure the order
+        is looked up by that id and resubmitted over REST only if the exchange has no
+        record of it; a fill cannot be undone, so the id alone does not prevent a
+        second order. WebSocket submission is then disabled for the rest of the
+        session. Error replies from the server are raised as BinanceAPIException
+        and never retried.
+        """
+        if 'quantity' in params:
+            params['quantity'] = self.format_quantity(params['symbol'], params['quantity'])
+        try:
+            if self.ws_orders:
+                id_key = ('clientAlgoId' if str(params.get('type', '')).upper() in CONDITIONAL_ORDER_TYPES
+                          else 'newClientOrderId')
+                params.setdefault(id_key, self.client.CONTRACT_ORDER_PREFIX + self.client.uuid22())
+                try:
+                    return self._ws_executor.submit(self.client.ws_futures_create_order, **params).result()
+                except BinanceWebsocketUnableToConnect as e:
+                    error = e.args[0] if e.args else None
+                    if isinstance(error, dict):
+                        # The exchange answered with an error: a rejected order, not a transport failure.
+                        raise BinanceAPIException(None, 400, json.dumps(error)) from e
+                    logger.warning(f"WebSocket order API unavailable, using REST: {e}")
+                    self.ws_orders = False
+                    existing = self._find_order(params['symbol'], id_key, params[id_key])
+                    if existing is not None:
+                        logger.info("Order %s reached the exchange before the WebSocket failed", params[id_key])
+                        return existing
+            return self.client.futures_create_order(**params)
+        except BinanceAPIException as e:
+            if e.code != INVALID_SYMBOL_CODE:
+                raise
+            # Cached exchange info still lists the symbol; remember the server's verdict instead.
+            self._bad_symbols.add(params['symbol'])
+            raise ValueError(f"Invalid symbol: {params['symbol']}") from e
+
+    def _find_order(self, symbol: str, id_key: str, client_id: str) -> Optional[Dict[str, Any]]:
+        """Return the order placed with client order id `client_id`, or None if the exchange has none."""
+        lookup = {'clientAlgoId': client_id} if id_key == 'clientAlgoId' else {'origClientOrderId': client_id}
+        try:
+            return self.client.futures_get_order(symbol=symbol, **lookup)
+        except BinanceAPIException as e:
+            if e.code == ORDER_NOT_FOUND_CODE:
+                return None
+            raise
+
+    def format_quantity(self, symbol: str, quantity: float) -> str:
+        """Floor `quantity` to the symbol's LOT_SIZE step and render it with exactly the step's decimals.
+
+        `str(float)` can yield '1e-05' or '0.30000000000000004', which Binance
+        rejects with -1111; the fixed-point text here never does.
+        """
+        info = self._symbols_by_name.get(symbol)
+        lot = info['_lot_filter'] if info is not None else None
+        if lot is None:
+            return str(quantity)
+        return f"{self.round_step_size(quantity, lot.step_size):.{lot.decimals}f}"
 
     def get_quantity_precision(self, symbol_info: Dict[str, Any]) -> int:
         return int(symbol_info.get('quantityPrecision', 0))
@@ -64,42 +268,281 @@ class BasicBot:
         return int(symbol_info.get('pricePrecision', 0))
 
     def round_step_size(self, quantity: float, step_size: float) -> float:
-        return float(Decimal(str(quantity)).quantize(Decimal(str(step_size)), rounding=ROUND_DOWN))
+        """Round `quantity` down to a multiple of `step_size`.
+
+        The inverse step and decimal scale are computed once per step size, so
+        each call is a multiply, a floor and a round.
+        """
+        inv_step, scale = self._get_step_params(step_size)
+        # The relative tolerance keeps exact multiples such as 0.003 / 0.001 = 2.9999999999999996 from
+        # dropping a step; being relative, it still exceeds float spacing for large quantity / step ratios.
+        return round(math.floor(quantity * inv_step * (1 + 1e-12)) / inv_step, scale)
+
+    def round_price(self, price: float, tick_size: float) -> PricePoint:
+        """Round `price` down to `tick_size` and format it with exactly the tick's decimals.
+
+        `str(float)` can produce forms such as '1e-05' or '0.30000000000000004'
+        that Binance rejects; the text here is always plain fixed-point.
+        """
+        value = self.round_step_size(price, tick_size)
+        return PricePoint(value, f"{value:.{self._get_step_params(tick_size)[1]}f}")
+
+    def _get_step_params(self, step_size: float) -> Tuple[float, int]:
+        """Return (1 / step_size, decimal places of step_size), computed once per step size."""
+        params = self._step_params.get(step_size)
+        if params is None:
+            scale = max(0, -Decimal(str(step_size)).normalize().as_tuple().exponent)
+            params = self._step_params[step_size] = (1.0 / step_size, scale)
+        return params
+
+    def _exchange_info_cache_path(self) -> str:
+        name = 'exchange_info_testnet.json' if self.testnet else 'exchange_info.json'
+        return os.path.join(EXCHANGE_INFO_CACHE_DIR, name)
+
+    def _load_exchange_info(self) -> Dict[str, Any]:
+        """Fetch futures exchange info, served from the on-disk cache while it is fresh.
+
+        Dry-run never touches the disk cache so DummyClient data cannot leak into it.
+        """
+        if self.dry_run:
+            return self.client.futures_exchange_info()
+
+        path = self._exchange_info_cache_path()
+        stale = None
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+            if os.path.getmtime(path) > time.time() - EXCHANGE_INFO_CACHE_TTL:
+                return cached
+            stale = cached
+        except (OSError, ValueError):
+            pass
+
+        info = self._fetch_exchange_info(stale)
+        if info is stale:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return info
+        try:
+            os.makedirs(EXCHANGE_INFO_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=EXCHANGE_INFO_CACHE_DIR, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(info, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.error(f'Could not write exchange info cache: {e}')
+        return info
+
+    def _fetch_exchange_info(self, stale: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """GET exchangeInfo, revalidating `stale` with the ETag / Last-Modified stored alongside it.
+
+        Returns `stale` itself when the server answers 304. Any other non-200
+        answer is retried through the SDK so errors surface as BinanceAPIException.
+        """
+        headers = {}
+        validators = stale.get(EXCHANGE_INFO_VALIDATORS_KEY, {}) if stale else {}
+        if 'ETag' in validators:
+            headers['If-None-Match'] = validators['ETag']
+        if 'Last-Modified' in validators:
+            headers['If-Modified-Since'] = validators['Last-Modified']
+
+        try:
+            response = self.client.session.get(
+                self.client._create_futures_api_uri('exchangeInfo'),
+                headers=headers,
+                timeout=self.client.REQUEST_TIMEOUT
+            )
+            if response.status_code == 304 and stale is not None:
+                logger.info('Exchange info not modified; keeping cached copy')
+                return stale
+            if response.status_code == 200:
+                info = response.json()
+                info[EXCHANGE_INFO_VALIDATORS_KEY] = {
+                    name: response.headers[name]
+                    for name in ('ETag', 'Last-Modified') if name in response.headers
+                }
+                return info
+        except (OSError, ValueError) as e:
+            logger.error(f'Conditional exchange info request failed: {e}')
+        return self.client.futures_exchange_info()
+
+    def _get_exchange_info(self, force: bool = False) -> Dict[str, Any]:
+        """Return exchange info, reloading it once the in-process copy is older than _EXCHANGE_INFO_TTL.
+
+        `force` reloads regardless of age (used by the background refresher).
+        Concurrent reloads share a single fetch. The symbol name set and
+        name->info dict are rebuilt alongside the payload.
+        """
+        cached = self._exchange_info_cache
+        if not force and cached is not None and time.time() - cached[0] < self._EXCHANGE_INFO_TTL:
+            return cached[1]
+
+        return self._single_flight('exchange_info', self._reload_exchange_info)
+
+    def _reload_exchange_info(self) -> Dict[str, Any]:
+        return self._install_exchange_info(self._load_exchange_info())
+
+    def _install_exchange_info(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        for item in info['symbols']:
+            self._attach_filters(item)
+        self._symbols_by_name = {sys.intern(item['symbol']): item for item in info['symbols']}
+        self._symbols_set = frozenset(self._symbols_by_name)
+        self._symbol_handles = {}
+        self._exchange_info_cache = (time.time(), info)
+        return info
+
+    def _single_flight(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """Run `fetch`, or wait for the identical call another thread already has in flight."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            result = fetch()
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    @staticmethod
+    def _attach_filters(symbol_info: Dict[str, Any]):
+        """Parse PRICE_FILTER and LOT_SIZE once into `_price_filter` / `_lot_filter` (None if absent)."""
+        symbol_info['_price_filter'] = None
+        symbol_info['_lot_filter'] = None
+        for f in symbol_info.get('filters', ()):
+            if f['filterType'] == 'PRICE_FILTER':
+                symbol_info['_price_filter'] = PriceFilter(
+                    float(f['minPrice']), float(f['maxPrice']), float(f['tickSize'])
+                )
+            elif f['filterType'] == 'LOT_SIZE':
+                symbol_info['_lot_filter'] = LotSize(
+                    float(f['minQty']), float(f['maxQty']), float(f['stepSize']),
+                    max(0, -Decimal(f['stepSize']).normalize().as_tuple().exponent)
+                )
+
+    def invalidate_exchange_info(self):
+        """Drop cached exchange info (in memory and on disk) so the next lookup refetches it."""
+        self._exchange_info_cache = None
+        if self.dry_run:
+            return
+        try:
+            os.remove(self._exchange_info_cache_path())
+        except OSError:
+            pass
 
     def validate_symbol(self, symbol: str) -> bool:
+        """Return whether `symbol` is listed, via a set lookup on the cached symbol names."""
         try:
-            info = self.client.futures_exchange_info()
-            symbols = [s['symbol'] for s in info['symbols']]
-            return symbol.upper() in symbols
+            self._get_exchange_info()
         except Exception as e:
-            logger.error(f'validate_symbol exception: {e}')
+            logger.error(f'Validate symbol error: {e}')
             return False
+        if symbol in self._symbols_set and symbol not in self._bad_symbols:
+            return True
+        return self.get_symbol_info(symbol) is not None
 
     def format_side(self, side: str) -> str:
-        s = side.lower()
-        if s not in ('buy', 'sell'):
+        formatted = _SIDE_MAP.get(side) or _SIDE_MAP.get(side.lower())
+        if formatted is None:
             raise ValueError('side must be buy or sell')
-        return 'BUY' if s == 'buy' else 'SELL'
+        return formatted
 
     def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return exchange info for `symbol` from the cached exchange info.
+
+        Handlers upper-case the symbol once at their entry point, so the exact
+        lookup normally hits and `.upper()` only runs for mixed-case input.
+        A symbol missing from the cache triggers one full refetch (it may be
+        newly listed); symbols still missing afterwards, or rejected by the
+        server with -1121, are remembered and answered with None for the rest
+        of the session.
+        """
         try:
-            info = self.client.futures_exchange_info()
-            for item in info['symbols']:
-                if item['symbol'] == symbol.upper():
-                    return item
-            return None
+            self._get_exchange_info()
+            info = self._symbols_by_name.get(symbol)
+            if info is None:
+                symbol = symbol.upper()
+                info = self._symbols_by_name.get(symbol)
+            if symbol in self._bad_symbols:
+                return None
+            if info is None:
+                info = self._refetch_for_symbol(symbol)
+            return info
         except Exception as e:
             logger.error(f'Get symbol info error: {e}')
             return None
 
+    def symbol(self, name: str) -> SymbolHandle:
+        """Return a memoized handle for `name` (any case); raises ValueError for unknown symbols.
+
+        Handles are rebuilt after each exchange-info refresh, so call this again
+        rather than holding one across long sessions.
+        """
+        handle = self._symbol_handles.get(name)
+        if handle is None:
+            symbol = name.upper()
+            info = self.get_symbol_info(symbol)
+            if info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
+            handle = self._symbol_handles[name] = SymbolHandle(sys.intern(symbol), info['_lot_filter'])
+        return handle
+
+    def _refetch_for_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Refetch exchange info in memory only, revalidating the current copy's ETag / Last-Modified.
+
+        The disk cache is left alone: an unknown symbol is usually a typo, and
+        must not cost the cached payload or its validators.
+        """
+        logger.info('Symbol %s not in cached exchange info; refetching', symbol)
+        if self.dry_run:
+            refetch = self.client.futures_exchange_info
+        else:
+            cached = self._exchange_info_cache
+            stale = cached[1] if cached is not None else None
+            refetch = lambda: self._fetch_exchange_info(stale)
+        self._single_flight('exchange_info', lambda: self._install_exchange_info(refetch()))
+        info = self._symbols_by_name.get(symbol)
+        if info is None:
+            self._bad_symbols.add(symbol)
+        return info
+
     def get_account_balance(self) -> List[Dict[str, Any]]:
         try:
-            return self.client.futures_account_balance()
+            return self._single_flight('balance', self.client.futures_account_balance)
         except Exception as e:
             logger.error(f'Get account balance error: {e}')
             return []
 
 
+class SigningClient(Client):
+    """python-binance Client that keys the request-signing HMAC once.
+
+    Each signature copies the pre-keyed HMAC instead of rebuilding the
+    SHA-256 inner/outer pads from the secret on every request.
+    """
+    _hmac_template: Optional['hmac.HMAC'] = None
+
+    def _hmac_signature(self, query_string: str) -> str:
+        template = self._hmac_template
+        if template is None:
+            assert self.API_SECRET, "API Secret required for private endpoints"
+            template = self._hmac_template = hmac.new(self.API_SECRET.encode('utf-8'), digestmod=hashlib.sha256)
+        h = template.copy()
+        h.update(query_string.encode('utf-8'))
+        return h.hexdigest()
+
+
 class DummyClient:
     """A very small fake client that mimics the futures methods used by the bot.
     Returns deterministic, safe responses for testing the CLI without network calls.
@@ -138,10 +581,68 @@ class DummyClient:
         }
         return order
 
+    def futures_place_batch_order(self, **kwargs):
+        return [self.futures_create_order(**order) for order in kwargs.get('batchOrders', [])]
+
     def futures_get_order(self, **kwargs):
         return {'orderId': kwargs.get('orderId'), 'status': 'FILLED'}
 
+    def futures_get_open_orders(self, **kwargs):
+        return []
+
     def futures_cancel_order(self, **kwargs):
         return {'orderId': kwargs.get('orderId'), 'status': 'CANCELED'}
-        
-    
+
+    def futures_cancel_orders(self, **kwargs):
+        return [{'orderId': order_id, 'status': 'CANCELED'} for order_id in kwargs.get('orderidlist', [])]
+
+    def futures_cancel_all_open_orders(self, **kwargs):
+        return {'code': 200, 'msg': 'The operation of cancel all open order is done.'}
+
+
+class UserDataStream:
+    """Futures user data stream that forwards ORDER_TRADE_UPDATE payloads to a callback.
+
+    `on_order_update` receives the order section (`msg['o']`) of each event.
+    `on_error` is called when the socket reports an error so callers can fall
+    back to REST polling.
+    """
+    def __init__(self, bot: BasicBot, on_order_update: Callable[[Dict[str, Any]], None],
+                 on_error: Optional[Callable[[], None]] = None):
+        self.bot = bot
+        self._on_order_update = on_order_update
+        self._on_error = on_error
+        self._twm = None
+
+    def start(self):
+        from binance import ThreadedWebsocketManager
+
+        self._twm = ThreadedWebsocketManager(
+            api_key=self.bot._api_key,
+            api_secret=self.bot._api_secret,
+            testnet=self.bot.testnet
+        )
+        try:
+            self._twm.start()
+            self._twm.start_futures_user_socket(callback=self._handle_message)
+        except Exception:
+            self.stop()
+            raise
+        logger.info("Futures user data stream started")
+
+    def _handle_message(self, msg: Dict[str, Any]):
+        event = msg.get('e')
+        if event == 'ORDER_TRADE_UPDATE':
+            self._on_order_update(msg['o'])
+        elif event == 'error':
+            logger.error(f"User data stream error: {msg.get('m')}")
+            if self._on_error is not None:
+                self._on_error()
+
+    def stop(self):
+        if self._twm is not None:
+            try:
+                self._twm.stop()
+            except Exception as e:
+                logger.error(f"Error stopping user data stream: {e}")
+            self._twm = None
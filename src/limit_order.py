@@ -2,7 +2,7 @@
 
 from typing import Dict, Any
 from decimal import Decimal
-from src.common import BasicBot, logger
+from src.common import BasicBot, PricePoint, logger
 from binance.enums import *
 from binance.exceptions import BinanceAPIException
 
@@ -26,22 +26,17 @@ class LimitOrder:
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
             
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'LOT_SIZE':
-                min_qty = float(filter['minQty'])
-                max_qty = float(filter['maxQty'])
-                step_size = float(filter['stepSize'])
-                
-                if quantity < min_qty:
-                    raise ValueError(f"Quantity {quantity} below minimum {min_qty}")
-                if quantity > max_qty:
-                    raise ValueError(f"Quantity {quantity} above maximum {max_qty}")
-                
-                quantity = self.bot.round_step_size(quantity, step_size)
-                
-        return quantity
+        lot = symbol_info['_lot_filter']
+        if lot is None:
+            return quantity
+        if quantity < lot.min_qty:
+            raise ValueError(f"Quantity {quantity} below minimum {lot.min_qty}")
+        if quantity > lot.max_qty:
+            raise ValueError(f"Quantity {quantity} above maximum {lot.max_qty}")
+        
+        return self.bot.round_step_size(quantity, lot.step_size)
 
-    def _validate_price(self, symbol_info: Dict[str, Any], price: float) -> float:
+    def _validate_price(self, symbol_info: Dict[str, Any], price: float) -> PricePoint:
         """
         Validate and format the order price according to symbol rules.
         
@@ -50,25 +45,39 @@ class LimitOrder:
             price: Original price
             
         Returns:
-            Formatted price that meets symbol requirements
+            Rounded price and its API string
         """
         if price <= 0:
             raise ValueError("Price must be positive")
             
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'PRICE_FILTER':
-                min_price = float(filter['minPrice'])
-                max_price = float(filter['maxPrice'])
-                tick_size = float(filter['tickSize'])
-                
-                if price < min_price:
-                    raise ValueError(f"Price {price} below minimum {min_price}")
-                if price > max_price:
-                    raise ValueError(f"Price {price} above maximum {max_price}")
-                
-                price = self.bot.round_step_size(price, tick_size)
-                
-        return price
+        pf = symbol_info['_price_filter']
+        if pf is None:
+            return PricePoint(price, str(price))
+        if price < pf.min_price:
+            raise ValueError(f"Price {price} below minimum {pf.min_price}")
+        if price > pf.max_price:
+            raise ValueError(f"Price {price} above maximum {pf.max_price}")
+        
+        return self.bot.round_price(price, pf.tick_size)
+
+    def _place_prevalidated(self, symbol: str, side: str, quantity: float,
+                            price: PricePoint, time_in_force: str = 'GTC') -> Dict[str, Any]:
+        """Submit a limit order whose inputs are already normalized.
+
+        The caller guarantees an upper-case symbol, a formatted side, a rounded
+        quantity and price, and a valid time in force.
+        """
+        order = self.bot.create_order(
+            symbol=symbol,
+            side=side,
+            type=self.ORDER_TYPE_LIMIT,
+            timeInForce=time_in_force,
+            quantity=quantity,
+            price=price.text
+        )
+        
+        logger.info("Limit order placed successfully: %s", order)
+        return order
 
     def place_order(self, symbol: str, side: str, quantity: float, 
                    price: float, time_in_force: str = 'GTC') -> Dict[str, Any]:
@@ -91,12 +100,9 @@ class LimitOrder:
         """
         try:
             symbol = symbol.upper()
-            if not self.bot.validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
-                
             symbol_info = self.bot.get_symbol_info(symbol)
-            if not symbol_info:
-                raise ValueError(f"Could not get symbol info for {symbol}")
+            if symbol_info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
             
             side = self.bot.format_side(side)
             quantity = self._validate_quantity(symbol_info, quantity)
@@ -106,17 +112,7 @@ class LimitOrder:
             if time_in_force not in ['GTC', 'IOC', 'FOK']:
                 raise ValueError("Time in force must be 'GTC', 'IOC', or 'FOK'")
             
-            order = self.bot.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type=self.ORDER_TYPE_LIMIT,
-                timeInForce=time_in_force,
-                quantity=quantity,
-                price=str(price)
-            )
-            
-            logger.info(f"Limit order placed successfully: {order}")
-            return order
+            return self._place_prevalidated(symbol, side, quantity, price, time_in_force)
             
         except BinanceAPIException as e:
             logger.error(f"Binance API error placing limit order: {str(e)}")
@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
 
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
-from src.common import BasicBot, logger
+from src.common import BasicBot, LotSize, SymbolHandle, logger
 from binance.enums import *
 from binance.exceptions import BinanceAPIException
 
+# Market orders in flight at once in place_orders; fits inside the session's connection pool.
+MARKET_ORDER_WORKERS = 8
+
 class MarketOrder:
     def __init__(self, bot: BasicBot):
         """Initialize MarketOrder handler."""
@@ -23,23 +27,33 @@ class MarketOrder:
         Returns:
             Formatted quantity that meets symbol requirements
         """
+        return self._validate_lot(symbol_info['_lot_filter'], quantity)
+
+    def _validate_lot(self, lot: Optional[LotSize], quantity: float) -> float:
+        """Check `quantity` against a parsed LOT_SIZE filter and round it to the step."""
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
             
-        for filter in symbol_info['filters']:
-            if filter['filterType'] == 'LOT_SIZE':
-                min_qty = float(filter['minQty'])
-                max_qty = float(filter['maxQty'])
-                step_size = float(filter['stepSize'])
-                
-                if quantity < min_qty:
-                    raise ValueError(f"Quantity {quantity} below minimum {min_qty}")
-                if quantity > max_qty:
-                    raise ValueError(f"Quantity {quantity} above maximum {max_qty}")
-                
-                quantity = self.bot.round_step_size(quantity, step_size)
-                
-        return quantity
+        if lot is None:
+            return quantity
+        if quantity < lot.min_qty:
+            raise ValueError(f"Quantity {quantity} below minimum {lot.min_qty}")
+        if quantity > lot.max_qty:
+            raise ValueError(f"Quantity {quantity} above maximum {lot.max_qty}")
+        
+        return self.bot.round_step_size(quantity, lot.step_size)
+
+    def _place_prevalidated(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
+        """Submit a market order whose symbol, side and quantity are already normalized."""
+        order = self.bot.create_order(
+            symbol=symbol,
+            side=side,
+            type=self.ORDER_TYPE_MARKET,
+            quantity=quantity
+        )
+        
+        logger.info("Market order placed successfully: %s", order)
+        return order
 
     def place_order(self, symbol: str, side: str, quantity: float) -> Dict[str, Any]:
         """
@@ -59,26 +73,46 @@ class MarketOrder:
         """
         try:
             symbol = symbol.upper()
-            if not self.bot.validate_symbol(symbol):
-                raise ValueError(f"Invalid symbol: {symbol}")
-                
             symbol_info = self.bot.get_symbol_info(symbol)
-            if not symbol_info:
-                raise ValueError(f"Could not get symbol info for {symbol}")
+            if symbol_info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
             
             side = self.bot.format_side(side)
             quantity = self._validate_quantity(symbol_info, quantity)
             
-            order = self.bot.client.futures_create_order(
-                symbol=symbol,
-                side=side,
-                type=self.ORDER_TYPE_MARKET,
-                quantity=quantity
-            )
+            return self._place_prevalidated(symbol, side, quantity)
             
-            logger.info(f"Market order placed successfully: {order}")
-            return order
+        except BinanceAPIException as e:
+            logger.error(f"Binance API error placing market order: {str(e)}")
+            raise
+        except ValueError as e:
+            logger.error(f"Validation error: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error placing market order: {str(e)}")
+            raise
+
+    def place_order_handle(self, handle: SymbolHandle, side: str, quantity: float) -> Dict[str, Any]:
+        """
+        Place a market order for a symbol resolved once with `bot.symbol()`.
+        
+        Skips upper-casing and the symbol lookup; only the side and the
+        quantity are checked per call, and the handle's per-side parameter
+        template supplies everything but the quantity.
+        
+        Args:
+            handle: Symbol handle from BasicBot.symbol
+            side: Order side ('BUY' or 'SELL')
+            quantity: Order quantity
             
+        Returns:
+            Dict containing order details from Binance
+        """
+        try:
+            template = handle.market_orders[self.bot.format_side(side)]
+            order = self.bot.create_order(quantity=self._validate_lot(handle.lot, quantity), **template)
+            logger.info("Market order placed successfully: %s", order)
+            return order
         except BinanceAPIException as e:
             logger.error(f"Binance API error placing market order: {str(e)}")
             raise
@@ -87,4 +121,48 @@ class MarketOrder:
             raise
         except Exception as e:
             logger.error(f"Unexpected error placing market order: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def place_orders(self, batch: List[Tuple[str, str, float]]) -> List[Dict[str, Any]]:
+        """
+        Place several market orders at once.
+        
+        Every (symbol, side, quantity) entry is validated before anything is
+        sent, then the orders are submitted concurrently over the bot's pooled
+        connections.
+        
+        Args:
+            batch: List of (symbol, side, quantity) tuples
+            
+        Returns:
+            Order responses in the same order as `batch`. Like Binance's batch
+            endpoint, an order that fails once submitted (API rejection, network
+            error, ...) is returned as a {'code': ..., 'msg': ...} dict instead of
+            failing the whole batch; `code` is None for non-API errors.
+            
+        Raises:
+            ValueError: If any entry fails validation (raised before any order is sent)
+        """
+        prepared = []
+        for symbol, side, quantity in batch:
+            symbol = symbol.upper()
+            symbol_info = self.bot.get_symbol_info(symbol)
+            if symbol_info is None:
+                raise ValueError(f"Invalid symbol: {symbol}")
+            prepared.append((symbol, self.bot.format_side(side),
+                             self._validate_quantity(symbol_info, quantity)))
+        
+        with ThreadPoolExecutor(max_workers=MARKET_ORDER_WORKERS) as executor:
+            futures = [executor.submit(self._place_prevalidated, *order) for order in prepared]
+        
+        results = []
+        for (symbol, side, quantity), future in zip(prepared, futures):
+            try:
+                results.append(future.result())
+            except BinanceAPIException as e:
+                logger.error(f"Binance API error placing market order {symbol} {side} {quantity}: {str(e)}")
+                results.append({'code': e.code, 'msg': e.message})
+            except Exception as e:
+                logger.error(f"Error placing market order {symbol} {side} {quantity}: {str(e)}")
+                results.append({'code': None, 'msg': str(e)})
+        return results